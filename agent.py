@@ -4,11 +4,147 @@ import requests
 import json
 from datetime import datetime
 import hashlib
+import heapq
+import re
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import combinations, islice
+
+# Technology trends
+_TECH_TRENDS = (
+    'ai-agents', 'automation', 'serverless', 'nocode', 'defi',
+    'metaverse', 'nft', 'crypto', 'blockchain', 'web3',
+    'saas', 'productivity', 'remote-work', 'sustainability'
+)
+
+# Business trends
+_BUSINESS_TRENDS = (
+    'digital-nomad', 'side-hustle', 'passive-income', 'ecommerce',
+    'dropshipping', 'affiliate', 'influencer', 'coaching'
+)
+
+_STATIC_TRENDS = _TECH_TRENDS + _BUSINESS_TRENDS
+
+# Keyword alternations scanned in one pass by the regex engine. These are
+# substring matches, like the `keyword in text` checks they replace.
+_HIGH_VALUE_RE = re.compile(r'ai|crypto|saas|app')
+_MED_VALUE_RE = re.compile(r'tool|pro|business')
+_TECH_RE = re.compile(r'ai|automation|saas|app')
+_BIZ_RE = re.compile(r'income|money|profit|business')
+# Lookahead so overlapping keywords (e.g. "get" and "tool" in "getool") all match
+_VALUABLE_KEYWORDS_RE = re.compile(r'(?=(ai|app|tool|pro|get|use))')
+
+# Domain value bonuses by TLD and by name length (<=6, <=10, longer)
+_TLD_BONUS = {'com': 200, 'ai': 150, 'io': 100}
+_LEN_BONUS_THRESHOLDS = (6, 10)
+_LEN_BONUS_VALUES = (300, 100, 0)
+
+# Time to sell for domains valued <=200, <=500 and above
+_SELL_TIME_BUCKETS = ("6-12 months", "3-6 months", "1-3 months")
+
+# Marketing strategy shared by every evaluated domain
+_MARKETING_STRATEGIES = (
+    'List on domain marketplaces (Sedo, Flippa)',
+    'Direct outreach to relevant businesses',
+    'Social media promotion',
+    'Domain auction participation'
+)
+
+
+@lru_cache(maxsize=4096)
+def estimate_domain_value(name, tld):
+    """Estimate domain value from its precomputed name and TLD"""
+    base_value = 100
+    
+    # TLD bonus
+    base_value += _TLD_BONUS.get(tld, 0)
+    
+    # Length penalty
+    base_value += _LEN_BONUS_VALUES[bisect_left(_LEN_BONUS_THRESHOLDS, len(name))]
+    
+    # Keyword value (each distinct keyword counts once)
+    base_value += len(set(_VALUABLE_KEYWORDS_RE.findall(name))) * 200
+    
+    return base_value
+
+
+@lru_cache(maxsize=4096)
+def calculate_profit_potential(name, tld):
+    """Calculate profit potential for domain"""
+    estimated_value = estimate_domain_value(name, tld)
+    registration_cost = 15
+    
+    # Conservative profit estimate (sell for 10-50x registration cost)
+    profit_multiplier = min(estimated_value / 100, 50)
+    profit_potential = (registration_cost * profit_multiplier) - registration_cost
+    
+    return max(profit_potential, 0)
+
+
+@lru_cache(maxsize=4096)
+def estimate_sell_time(name, tld):
+    """Estimate time to sell domain"""
+    value = estimate_domain_value(name, tld)
+    return _SELL_TIME_BUCKETS[(value > 200) + (value > 500)]
+
+
+def make_domain_idea(name, tld):
+    """Build a domain idea with the fields the scoring functions read"""
+    return {'domain': f"{name}.{tld}", '_name': name, '_tld': tld}
+
+
+@lru_cache(maxsize=4096)
+def calculate_trend_potential(trend):
+    """Calculate commercial potential of trend"""
+    # Simplified scoring based on trend characteristics
+    score = 50  # Base score
+    
+    # Short trends get bonus (better for domains)
+    if len(trend) <= 8:
+        score += 20
+    
+    # Technology trends get bonus
+    if _TECH_RE.search(trend):
+        score += 30
+    
+    # Business trends get bonus
+    if _BIZ_RE.search(trend):
+        score += 25
+    
+    return min(score, 100)
+
+
+@lru_cache(maxsize=4096)
+def estimate_commercial_value(trend):
+    """Estimate commercial value of trend"""
+    values = {
+        'high': '$1000+',
+        'medium': '$500-1000', 
+        'low': '$100-500'
+    }
+    
+    # High value trends
+    if _HIGH_VALUE_RE.search(trend):
+        return values['high']
+    elif _MED_VALUE_RE.search(trend):
+        return values['medium']
+    else:
+        return values['low']
+
 
 class DomainFlipper:
     def __init__(self, github_token):
         self.token = github_token
         self.headers = {'Authorization': f'token {github_token}'}
+        # Pooled keep-alive connection to the GitHub API
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # query -> (ETag, items) for conditional search requests
+        self._etags = {}
+        # (monotonic timestamp, result) of the last find_trending_keywords call
+        self._trending_cache = None
         
     def operate_domain_flipping(self):
         """Operate automated domain flipping business"""
@@ -28,37 +164,35 @@ class DomainFlipper:
         
         return flipping_strategy
     
-    def find_trending_keywords(self):
+    def find_trending_keywords(self, ttl=3600):
+        """Find trending keywords, reusing results fresher than ttl seconds"""
+        now = time.monotonic()
+        if self._trending_cache and now - self._trending_cache[0] < ttl:
+            return self._trending_cache[1]
+        
+        trending_keywords = self._compute_trending_keywords()
+        self._trending_cache = (now, trending_keywords)
+        return trending_keywords
+    
+    def _compute_trending_keywords(self):
         """Find trending keywords for domain generation"""
         # Analyze GitHub trending topics
         github_trends = self.analyze_github_trends()
         
-        # Technology trends
-        tech_trends = [
-            'ai-agents', 'automation', 'serverless', 'nocode', 'defi',
-            'metaverse', 'nft', 'crypto', 'blockchain', 'web3',
-            'saas', 'productivity', 'remote-work', 'sustainability'
-        ]
+        all_trends = github_trends + list(_STATIC_TRENDS)
         
-        # Business trends  
-        business_trends = [
-            'digital-nomad', 'side-hustle', 'passive-income', 'ecommerce',
-            'dropshipping', 'affiliate', 'influencer', 'coaching'
-        ]
-        
-        all_trends = github_trends + tech_trends + business_trends
-        
-        # Score trends by potential
-        scored_trends = []
-        for trend in all_trends:
-            score = self.calculate_trend_potential(trend)
-            scored_trends.append({
-                'keyword': trend,
-                'score': score,
-                'commercial_value': self.estimate_commercial_value(trend)
-            })
+        # Score trends by potential, then build entries for the top 20 only
+        scores = [calculate_trend_potential(trend) for trend in all_trends]
+        top = heapq.nlargest(20, range(len(all_trends)), key=scores.__getitem__)
         
-        return sorted(scored_trends, key=lambda x: x['score'], reverse=True)[:20]
+        return [
+            {
+                'keyword': all_trends[i],
+                'score': scores[i],
+                'commercial_value': estimate_commercial_value(all_trends[i])
+            }
+            for i in top
+        ]
     
     def analyze_github_trends(self):
         """Analyze GitHub for trending topics"""
@@ -68,147 +202,102 @@ class DomainFlipper:
             'saas template created:>2024-01-01'
         ]
         
-        trends = []
-        for query in search_queries:
-            repos = self.search_repos(query)
+        # Run the searches concurrently over the shared session
+        with ThreadPoolExecutor(max_workers=len(search_queries)) as executor:
+            results = list(executor.map(self.search_repos, search_queries))
+        
+        # Dict keys dedupe while keeping first-seen order, so runs are reproducible
+        trends = {}
+        for repos in results:
             for repo in repos[:10]:
                 # Extract keywords from repo names and descriptions
-                keywords = self.extract_keywords(repo)
-                trends.extend(keywords)
+                trends.update(dict.fromkeys(self.extract_keywords(repo)))
         
-        return list(set(trends))
+        return list(trends)
     
     def extract_keywords(self, repo):
         """Extract valuable keywords from repository"""
         text = f"{repo['name']} {repo.get('description', '')}"
         
-        # Simple keyword extraction
+        # Simple keyword extraction, keeping the first five valuable words
         words = text.lower().replace('-', ' ').split()
-        
-        # Filter for valuable keywords
-        valuable_words = []
-        for word in words:
-            if len(word) > 3 and word.isalpha():
-                valuable_words.append(word)
-        
-        return valuable_words[:5]
+        return list(islice((word for word in words if len(word) > 3 and word.isalpha()), 5))
     
     def generate_domain_ideas(self, trending_keywords):
-        """Generate domain ideas from trending keywords"""
+        """Generate unique domain ideas from trending keywords"""
         domain_ideas = []
+        seen = set()
         
+        for idea in self.iter_domain_ideas(trending_keywords):
+            if idea['domain'] in seen:
+                continue
+            seen.add(idea['domain'])
+            domain_ideas.append(idea)
+            
+            # Only the first 50 ideas are ever evaluated
+            if len(domain_ideas) == 50:
+                break
+        
+        return domain_ideas
+    
+    def iter_domain_ideas(self, trending_keywords):
+        """Yield domain ideas from trending keywords, best candidates first"""
         # Single keyword domains
         for trend in trending_keywords[:10]:
             keyword = trend['keyword']
-            variations = [
-                f"{keyword}.com",
-                f"{keyword}.ai",
-                f"{keyword}.io",
-                f"get{keyword}.com",
-                f"use{keyword}.com",
-                f"{keyword}app.com",
-                f"{keyword}tool.com",
-                f"{keyword}pro.com"
-            ]
-            domain_ideas.extend(variations)
+            yield make_domain_idea(keyword, 'com')
+            yield make_domain_idea(keyword, 'ai')
+            yield make_domain_idea(keyword, 'io')
+            yield make_domain_idea(f"get{keyword}", 'com')
+            yield make_domain_idea(f"use{keyword}", 'com')
+            yield make_domain_idea(f"{keyword}app", 'com')
+            yield make_domain_idea(f"{keyword}tool", 'com')
+            yield make_domain_idea(f"{keyword}pro", 'com')
         
         # Combination domains
-        for i, trend1 in enumerate(trending_keywords[:5]):
-            for trend2 in trending_keywords[i+1:8]:
-                combo_domains = [
-                    f"{trend1['keyword']}{trend2['keyword']}.com",
-                    f"{trend1['keyword']}-{trend2['keyword']}.com"
-                ]
-                domain_ideas.extend(combo_domains)
-        
-        return domain_ideas
+        for trend1, trend2 in combinations(trending_keywords[:8], 2):
+            yield make_domain_idea(f"{trend1['keyword']}{trend2['keyword']}", 'com')
+            yield make_domain_idea(f"{trend1['keyword']}-{trend2['keyword']}", 'com')
     
     def evaluate_domains(self, domain_ideas):
         """Evaluate domains for value and availability"""
         valuable_domains = []
         
-        for domain in domain_ideas[:50]:  # Limit to top 50
-            evaluation = {
+        for idea in domain_ideas[:50]:  # Limit to top 50
+            name, tld = idea['_name'], idea['_tld']
+            
+            # Check profit first so rejected domains skip the full evaluation
+            profit_potential = calculate_profit_potential(name, tld)
+            if profit_potential <= 500:  # $500+ profit potential
+                continue
+            
+            domain = idea['domain']
+            valuable_domains.append({
                 'domain': domain,
-                'estimated_value': self.estimate_domain_value(domain),
+                'estimated_value': estimate_domain_value(name, tld),
                 'registration_cost': '$12-15',
-                'profit_potential': self.calculate_profit_potential(domain),
-                'time_to_sell': self.estimate_sell_time(domain),
-                'marketing_strategy': self.create_domain_marketing(domain)
-            }
-            
-            if evaluation['profit_potential'] > 500:  # $500+ profit potential
-                valuable_domains.append(evaluation)
+                'profit_potential': profit_potential,
+                'time_to_sell': estimate_sell_time(name, tld),
+                'marketing_strategy': _MARKETING_STRATEGIES
+            })
         
         return sorted(valuable_domains, key=lambda x: x['profit_potential'], reverse=True)
     
-    def estimate_domain_value(self, domain):
-        """Estimate domain value"""
-        base_value = 100
-        
-        # TLD bonus
-        if domain.endswith('.com'):
-            base_value += 200
-        elif domain.endswith('.ai'):
-            base_value += 150
-        elif domain.endswith('.io'):
-            base_value += 100
-        
-        # Length penalty
-        domain_name = domain.split('.')[0]
-        if len(domain_name) <= 6:
-            base_value += 300
-        elif len(domain_name) <= 10:
-            base_value += 100
-        
-        # Keyword value
-        valuable_keywords = ['ai', 'app', 'tool', 'pro', 'get', 'use']
-        for keyword in valuable_keywords:
-            if keyword in domain_name:
-                base_value += 200
-        
-        return base_value
-    
-    def calculate_profit_potential(self, domain):
-        """Calculate profit potential for domain"""
-        estimated_value = self.estimate_domain_value(domain)
-        registration_cost = 15
-        
-        # Conservative profit estimate (sell for 10-50x registration cost)
-        profit_multiplier = min(estimated_value / 100, 50)
-        profit_potential = (registration_cost * profit_multiplier) - registration_cost
-        
-        return max(profit_potential, 0)
-    
-    def estimate_sell_time(self, domain):
-        """Estimate time to sell domain"""
-        value = self.estimate_domain_value(domain)
-        
-        if value > 500:
-            return "1-3 months"
-        elif value > 200:
-            return "3-6 months"
-        else:
-            return "6-12 months"
-    
     def create_domain_marketing(self, domain):
         """Create marketing strategy for domain"""
-        strategies = [
-            'List on domain marketplaces (Sedo, Flippa)',
-            'Direct outreach to relevant businesses',
-            'Social media promotion',
-            'Domain auction participation'
-        ]
-        
-        return strategies
+        return _MARKETING_STRATEGIES
     
     def create_flipping_strategy(self, valuable_domains):
         """Create comprehensive domain flipping strategy"""
+        portfolio = valuable_domains[:20]  # Top 20 domains
+        total_investment = len(portfolio) * 15
+        projected_profit = sum(d['profit_potential'] for d in portfolio)
+        
         strategy = {
-            'portfolio': valuable_domains[:20],  # Top 20 domains
-            'total_investment': len(valuable_domains[:20]) * 15,
-            'projected_profit': sum(d['profit_potential'] for d in valuable_domains[:20]),
-            'roi_percentage': (sum(d['profit_potential'] for d in valuable_domains[:20]) / (len(valuable_domains[:20]) * 15)) * 100,
+            'portfolio': portfolio,
+            'total_investment': total_investment,
+            'projected_profit': projected_profit,
+            'roi_percentage': (projected_profit / total_investment) * 100 if total_investment else 0.0,
             'portfolio_management': {
                 'acquisition_budget': '$300/month',
                 'renewal_strategy': 'Renew high-value domains only',
@@ -230,47 +319,22 @@ class DomainFlipper:
         
         return strategy
     
-    def calculate_trend_potential(self, trend):
-        """Calculate commercial potential of trend"""
-        # Simplified scoring based on trend characteristics
-        score = 50  # Base score
-        
-        # Technology trends get bonus
-        if any(tech in trend for tech in ['ai', 'automation', 'saas', 'app']):
-            score += 30
-        
-        # Business trends get bonus
-        if any(biz in trend for biz in ['income', 'money', 'profit', 'business']):
-            score += 25
-        
-        # Short trends get bonus (better for domains)
-        if len(trend) <= 8:
-            score += 20
-        
-        return min(score, 100)
-    
-    def estimate_commercial_value(self, trend):
-        """Estimate commercial value of trend"""
-        values = {
-            'high': '$1000+',
-            'medium': '$500-1000', 
-            'low': '$100-500'
-        }
-        
-        # High value trends
-        if any(keyword in trend for keyword in ['ai', 'crypto', 'saas', 'app']):
-            return values['high']
-        elif any(keyword in trend for keyword in ['tool', 'pro', 'business']):
-            return values['medium']
-        else:
-            return values['low']
-    
     def search_repos(self, query):
         """Search GitHub repositories"""
         url = "https://api.github.com/search/repositories"
-        response = requests.get(url, params={'q': query}, headers=self.headers)
+        cached = self._etags.get(query)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        # Only the first 10 repos are used, so don't download the default 30
+        params = {'q': query, 'per_page': 10}
+        response = self.session.get(url, params=params, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return cached[1]
         if response.status_code == 200:
-            return response.json().get('items', [])
+            items = response.json().get('items', [])
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etags[query] = (etag, items)
+            return items
         return []
 
 if __name__ == "__main__":